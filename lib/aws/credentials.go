@@ -112,7 +112,7 @@ func (c *Credentials) assumeRole(ctx context.Context) error {
 			// Assume the custom role
 			input := &sts.AssumeRoleInput{
 				RoleArn:         aws.String(c.customRoleArn),
-				RoleSessionName: aws.String(sessionName(ctx)),
+				RoleSessionName: aws.String(sessionName(ctx, nil)),
 			}
 
 			// Add external ID if provided
@@ -153,7 +153,7 @@ func (c *Credentials) assumeRole(ctx context.Context) error {
 	// Assume the role
 	input := &sts.AssumeRoleInput{
 		RoleArn:         aws.String(c.roleArn),
-		RoleSessionName: aws.String(sessionName(ctx)),
+		RoleSessionName: aws.String(sessionName(ctx, svc)),
 	}
 
 	result, err := svc.AssumeRole(ctx, input)
@@ -192,9 +192,17 @@ func GetCallerIdentity(ctx context.Context) (out *sts.GetCallerIdentityOutput, e
 }
 
 // SessionName parses an SSO-based caller identity to return a session name for further role assumption.
-func sessionName(ctx context.Context) string {
+// svc, if non-nil, must be an STS client built from the default AWS configuration; it is reused
+// instead of loading that configuration a second time.
+func sessionName(ctx context.Context, svc *sts.Client) string {
 	var caller string
-	i, err := GetCallerIdentity(ctx)
+	var i *sts.GetCallerIdentityOutput
+	var err error
+	if svc != nil {
+		i, err = svc.GetCallerIdentity(ctx, &sts.GetCallerIdentityInput{})
+	} else {
+		i, err = GetCallerIdentity(ctx)
+	}
 	if err != nil {
 		caller = "unknown"
 	} else {
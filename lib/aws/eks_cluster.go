@@ -31,6 +31,7 @@ import (
 	"strings"
 
 	"github.com/posit-dev/ptd/lib/consts"
+	"github.com/posit-dev/ptd/lib/types"
 	awsec2 "github.com/pulumi/pulumi-aws/sdk/v6/go/aws/ec2"
 	awseks "github.com/pulumi/pulumi-aws/sdk/v6/go/aws/eks"
 	awsiam "github.com/pulumi/pulumi-aws/sdk/v6/go/aws/iam"
@@ -171,6 +172,10 @@ type EKSCluster struct {
 	// WithEncryptedEbsStorageClass (the storage-class patch must depend on the
 	// addon being ready), mirroring Python self.ebs_csi_addon.
 	ebsCsiAddon *awseks.Addon
+
+	// providerOption is pulumi.Provider(provider), built once when the
+	// provider is created and returned by providerOpt.
+	providerOption pulumi.ResourceOption
 }
 
 // nodeRolePolicy enumerates the managed policies attached to the default node
@@ -347,6 +352,7 @@ func NewEKSCluster(ctx *pulumi.Context, cfg EKSClusterConfig) (*EKSCluster, erro
 		return nil, fmt.Errorf("eks: failed to create K8s provider for %s: %w", cfg.Name, err)
 	}
 	c.provider = provider
+	c.providerOption = pulumi.Provider(provider)
 
 	// SG access: mirror aws_eks_cluster.py __init__ — tailscale takes precedence,
 	// else (unless a customer-managed bastion is used) wire the PTD bastion SG.
@@ -641,8 +647,9 @@ func (c *EKSCluster) WithOidcProvider() *EKSCluster {
 
 // providerOpt returns the Kubernetes provider resource option used by all K8s
 // resources the builder creates (mirrors Python opts.provider=self.provider).
+// The option is built once alongside the provider and shared by every caller.
 func (c *EKSCluster) providerOpt() pulumi.ResourceOption {
-	return pulumi.Provider(c.provider)
+	return c.providerOption
 }
 
 // ── ServiceAccount / IRSA roles ─────────────────────────────────────────────
@@ -747,7 +754,7 @@ type AwsAuthParams struct {
 	// UseEksAccessEntries dispatches to the modern access-entries path.
 	UseEksAccessEntries bool
 	// AdditionalAccessEntries are extra access entries (access-entries path only).
-	AdditionalAccessEntries []map[string]interface{}
+	AdditionalAccessEntries []types.EKSAccessEntry
 	// IncludePoweruser adds the PowerUser access entry (access-entries path only).
 	IncludePoweruser bool
 	// AdminRoleARN overrides the default admin role ARN (custom_role.role_arn).
@@ -985,52 +992,30 @@ func (c *EKSCluster) withEksAccessEntries(p AwsAuthParams) *EKSCluster {
 
 	// --- Additional access entries ---
 	for idx, entry := range p.AdditionalAccessEntries {
-		principalARN, _ := entry["principalArn"].(string)
+		principalARN := entry.PrincipalArn
 		if principalARN == "" {
 			continue
 		}
-		entryType, _ := entry["type"].(string)
+		entryType := entry.Type
 		if entryType == "" {
 			entryType = "STANDARD"
 		}
-		var kgroups []string
-		if kg, ok := entry["kubernetesGroups"].([]interface{}); ok {
-			for _, g := range kg {
-				if gs, ok := g.(string); ok {
-					kgroups = append(kgroups, gs)
-				}
-			}
-		}
-		ae, err := mkEntry(fmt.Sprintf("%s-additional-access-entry-%d", c.cfg.Name, idx), principalARN, entryType, entryImportID(principalARN), kgroups)
+		ae, err := mkEntry(fmt.Sprintf("%s-additional-access-entry-%d", c.cfg.Name, idx), principalARN, entryType, entryImportID(principalARN), entry.KubernetesGroups)
 		if err != nil {
 			c.err = fmt.Errorf("eks: failed to create additional access entry %d for %s: %w", idx, c.cfg.Name, err)
 			return c
 		}
 
-		policies, _ := entry["accessPolicies"].([]interface{})
-		for pIdx, raw := range policies {
-			pol, ok := raw.(map[string]interface{})
-			if !ok {
-				continue
-			}
-			policyARN, _ := pol["policyArn"].(string)
+		for pIdx, pol := range entry.AccessPolicies {
+			policyARN := pol.PolicyArn
 			if policyARN == "" {
 				continue
 			}
-			scopeType := "cluster"
-			var namespaces []string
-			if scope, ok := pol["accessScope"].(map[string]interface{}); ok {
-				if st, ok := scope["type"].(string); ok && st != "" {
-					scopeType = st
-				}
-				if ns, ok := scope["namespaces"].([]interface{}); ok {
-					for _, n := range ns {
-						if nss, ok := n.(string); ok {
-							namespaces = append(namespaces, nss)
-						}
-					}
-				}
+			scopeType := pol.AccessScope.Type
+			if scopeType == "" {
+				scopeType = "cluster"
 			}
+			namespaces := pol.AccessScope.Namespaces
 			// Python parented these associations on the AccessEntry; the entry was a
 			// child of the cluster, so the old URN type chain is
 			// <ParentTypeChain>$aws:eks/cluster:Cluster$aws:eks/accessEntry:AccessEntry$aws:eks/accessPolicyAssociation.
@@ -375,7 +375,7 @@ func TestEKSAccessEntriesBranch(t *testing.T) {
 	// admin + poweruser + node = 3 access entries; no aws-auth ConfigMapPatch.
 	assert.Len(t, mocks.byType("aws:eks/accessEntry:AccessEntry"), 3)
 	assert.GreaterOrEqual(t, len(mocks.byType("aws:eks/accessPolicyAssociation:AccessPolicyAssociation")), 2)
-	assert.Len(t, mocks.byType("kubernetes:core/v1:ConfigMapPatch"), 0)
+	assert.Empty(t, mocks.byType("kubernetes:core/v1:ConfigMapPatch"))
 	// Node entry adopts the existing "eks-node" ARN.
 	node := mocks.nameOf("wl01-staging-20250101-node-access-entry")
 	require.NotNil(t, node)
@@ -395,7 +395,7 @@ func TestEKSAwsAuthConfigMapBranch(t *testing.T) {
 
 	// Legacy path: an aws-auth ConfigMapPatch, no access entries.
 	assert.Len(t, mocks.byType("kubernetes:core/v1:ConfigMapPatch"), 1)
-	assert.Len(t, mocks.byType("aws:eks/accessEntry:AccessEntry"), 0)
+	assert.Empty(t, mocks.byType("aws:eks/accessEntry:AccessEntry"))
 }
 
 func TestEKSEfsCsiDriver(t *testing.T) {
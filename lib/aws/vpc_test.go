@@ -8,20 +8,41 @@ import (
 )
 
 func TestComputeSubnetCIDRs(t *testing.T) {
-	// 172.16.0.0/20 with 2 AZs is what the workspaces VPC uses.
-	public, private, err := computeSubnetCIDRs("172.16.0.0/20", 2)
-	require.NoError(t, err)
-	assert.Len(t, public, 2)
-	assert.Len(t, private, 2)
+	// Private subnets come from the first 3 of 4 equal top-level blocks; public
+	// subnets come from splitting the 4th block into 4 again.
+	tests := []struct {
+		name        string
+		cidr        string
+		azCount     int
+		wantPublic  []string
+		wantPrivate []string
+	}{
+		{
+			// 172.16.0.0/20 with 2 AZs is what the workspaces VPC uses.
+			// 4 x /22: 172.16.0.0/22, 172.16.4.0/22, 172.16.8.0/22, 172.16.12.0/22
+			name:        "workspaces /20 with 2 AZs",
+			cidr:        "172.16.0.0/20",
+			azCount:     2,
+			wantPublic:  []string{"172.16.12.0/24", "172.16.13.0/24"},
+			wantPrivate: []string{"172.16.0.0/22", "172.16.4.0/22"},
+		},
+		{
+			name:        "/16 with 3 AZs",
+			cidr:        "10.10.0.0/16",
+			azCount:     3,
+			wantPublic:  []string{"10.10.192.0/20", "10.10.208.0/20", "10.10.224.0/20"},
+			wantPrivate: []string{"10.10.0.0/18", "10.10.64.0/18", "10.10.128.0/18"},
+		},
+	}
 
-	// Private subnets come from the first 3 /22 blocks of a /20.
-	// 172.16.0.0/20 → 4 x /22: 172.16.0.0/22, 172.16.4.0/22, 172.16.8.0/22, 172.16.12.0/22
-	assert.Equal(t, "172.16.0.0/22", private[0])
-	assert.Equal(t, "172.16.4.0/22", private[1])
-
-	// Public subnets come from the 4th /22 (172.16.12.0/22) split into 4 x /24.
-	assert.Equal(t, "172.16.12.0/24", public[0])
-	assert.Equal(t, "172.16.13.0/24", public[1])
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			public, private, err := computeSubnetCIDRs(tt.cidr, tt.azCount)
+			require.NoError(t, err)
+			assert.Equal(t, tt.wantPublic, public)
+			assert.Equal(t, tt.wantPrivate, private)
+		})
+	}
 }
 
 func TestComputeSubnetCIDRsInvalidCIDR(t *testing.T) {
@@ -74,68 +74,73 @@ func TestCheckControlRoomConfigured_PartialFields(t *testing.T) {
 	assert.Equal(t, CheckPass, result.Checks[0].Status)
 }
 
-func TestCheckCredentials_Valid(t *testing.T) {
-	result := &PreflightResult{}
-	target := &typestest.MockTarget{}
-	creds := typestest.DefaultCredentials()
-	target.On("Credentials", mock.Anything).Return(creds, nil)
-
-	checkCredentials(context.Background(), result, target)
-
-	require.Len(t, result.Checks, 1)
-	assert.Equal(t, CheckPass, result.Checks[0].Status)
-	assert.Equal(t, "workload_credentials", result.Checks[0].Name)
-}
-
-func TestCheckCredentials_GetFails(t *testing.T) {
-	result := &PreflightResult{}
-	target := &typestest.MockTarget{}
-	target.On("Credentials", mock.Anything).Return((*typestest.MockCredentials)(nil), fmt.Errorf("no credentials"))
-
-	checkCredentials(context.Background(), result, target)
-
-	require.Len(t, result.Checks, 1)
-	assert.Equal(t, CheckFail, result.Checks[0].Status)
-	assert.Contains(t, result.Checks[0].Message, "no credentials")
-}
-
-func TestCheckCredentials_RefreshFails(t *testing.T) {
-	// Target.Credentials refreshes internally, so a refresh failure surfaces
-	// as an error from Credentials rather than via a separate Refresh call.
-	result := &PreflightResult{}
-	target := &typestest.MockTarget{}
-	target.On("Credentials", mock.Anything).Return((*typestest.MockCredentials)(nil), fmt.Errorf("expired"))
-
-	checkCredentials(context.Background(), result, target)
-
-	require.Len(t, result.Checks, 1)
-	assert.Equal(t, CheckFail, result.Checks[0].Status)
-	assert.Contains(t, result.Checks[0].Message, "expired")
-}
-
-func TestCheckControlRoomCredentials_Valid(t *testing.T) {
-	result := &PreflightResult{}
-	target := &typestest.MockTarget{}
-	creds := typestest.DefaultCredentials()
-	target.On("Credentials", mock.Anything).Return(creds, nil)
-
-	checkControlRoomCredentials(context.Background(), result, target)
-
-	require.Len(t, result.Checks, 1)
-	assert.Equal(t, CheckPass, result.Checks[0].Status)
-	assert.Equal(t, "control_room_reachable", result.Checks[0].Name)
-}
-
-func TestCheckControlRoomCredentials_Fails(t *testing.T) {
-	result := &PreflightResult{}
-	target := &typestest.MockTarget{}
-	target.On("Credentials", mock.Anything).Return((*typestest.MockCredentials)(nil), fmt.Errorf("access denied"))
-
-	checkControlRoomCredentials(context.Background(), result, target)
+func TestCheckCredentials(t *testing.T) {
+	tests := []struct {
+		name        string
+		check       func(context.Context, *PreflightResult, types.Target)
+		credsErr    error
+		wantName    string
+		wantStatus  CheckStatus
+		wantMessage string
+	}{
+		{
+			name:       "workload valid",
+			check:      checkCredentials,
+			wantName:   "workload_credentials",
+			wantStatus: CheckPass,
+		},
+		{
+			name:        "workload get fails",
+			check:       checkCredentials,
+			credsErr:    fmt.Errorf("no credentials"),
+			wantName:    "workload_credentials",
+			wantStatus:  CheckFail,
+			wantMessage: "no credentials",
+		},
+		{
+			// Target.Credentials refreshes internally, so a refresh failure surfaces
+			// as an error from Credentials rather than via a separate Refresh call.
+			name:        "workload refresh fails",
+			check:       checkCredentials,
+			credsErr:    fmt.Errorf("expired"),
+			wantName:    "workload_credentials",
+			wantStatus:  CheckFail,
+			wantMessage: "expired",
+		},
+		{
+			name:       "control room valid",
+			check:      checkControlRoomCredentials,
+			wantName:   "control_room_reachable",
+			wantStatus: CheckPass,
+		},
+		{
+			name:        "control room fails",
+			check:       checkControlRoomCredentials,
+			credsErr:    fmt.Errorf("access denied"),
+			wantName:    "control_room_reachable",
+			wantStatus:  CheckFail,
+			wantMessage: "access denied",
+		},
+	}
 
-	require.Len(t, result.Checks, 1)
-	assert.Equal(t, CheckFail, result.Checks[0].Status)
-	assert.Contains(t, result.Checks[0].Message, "access denied")
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			result := &PreflightResult{}
+			target := &typestest.MockTarget{}
+			if tt.credsErr != nil {
+				target.On("Credentials", mock.Anything).Return((*typestest.MockCredentials)(nil), tt.credsErr)
+			} else {
+				target.On("Credentials", mock.Anything).Return(typestest.DefaultCredentials(), nil)
+			}
+
+			tt.check(context.Background(), result, target)
+
+			require.Len(t, result.Checks, 1)
+			assert.Equal(t, tt.wantName, result.Checks[0].Name)
+			assert.Equal(t, tt.wantStatus, result.Checks[0].Status)
+			assert.Contains(t, result.Checks[0].Message, tt.wantMessage)
+		})
+	}
 }
 
 func TestPreflightResult_Passed_AllPass(t *testing.T) {
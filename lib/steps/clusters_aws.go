@@ -265,6 +265,12 @@ func awsClustersDeploy(ctx *pulumi.Context, _ types.Target, params awsClustersPa
 	for _, release := range releases {
 		clusterCfg := params.clusters[release].Spec
 		efsEnabled := clusterCfg.EnableEfsCsiDriver || clusterCfg.EfsConfig != nil
+		// The EFS policy depends only on the release's EFS config; build it once
+		// and share it between the workbench role and each session role.
+		efsPolicyDoc := ""
+		if clusterCfg.EfsConfig != nil {
+			efsPolicyDoc = buildEFSPolicy(clusterCfg.EfsConfig.FileSystemID, clusterCfg.EfsConfig.AccessPointID, params.accountID, params.region)
+		}
 
 		// ── K8s provider ──────────────────────────────────────────────────────
 		k8sProviderName := name + "-" + release + "-k8s"
@@ -387,7 +393,7 @@ func awsClustersDeploy(ctx *pulumi.Context, _ types.Target, params awsClustersPa
 		if efsEnabled && clusterCfg.EfsConfig != nil {
 			workbenchRolePolicies = append(workbenchRolePolicies, inlinePolicy{
 				name: workbenchRoleName + "-role-policy-1",
-				doc:  buildEFSPolicy(clusterCfg.EfsConfig.FileSystemID, clusterCfg.EfsConfig.AccessPointID, params.accountID, params.region),
+				doc:  efsPolicyDoc,
 			})
 		}
 		if err := createAWSIAMRole(ctx, workbenchRoleName, workbenchRoleName, clustersPositTeamNamespace, workbenchSAs,
@@ -403,7 +409,7 @@ func awsClustersDeploy(ctx *pulumi.Context, _ types.Target, params awsClustersPa
 			if efsEnabled && clusterCfg.EfsConfig != nil {
 				wbSessionPolicies = append(wbSessionPolicies, inlinePolicy{
 					name: workbenchSessionRoleName + "-role-policy-1",
-					doc:  buildEFSPolicy(clusterCfg.EfsConfig.FileSystemID, clusterCfg.EfsConfig.AccessPointID, params.accountID, params.region),
+					doc:  efsPolicyDoc,
 				})
 			}
 			if err := createAWSIAMRole(ctx, workbenchSessionRoleName, workbenchSessionRoleName, clustersPositTeamNamespace,
@@ -124,14 +124,6 @@ func (m *eksStepMocks) findResource(name string) *pulumi.MockResourceArgs {
 
 // --- step metadata ---
 
-func TestEKSStepName(t *testing.T) {
-	assert.Equal(t, "eks", (&EKSStep{}).Name())
-}
-
-func TestEKSStepProxyRequired(t *testing.T) {
-	assert.True(t, (&EKSStep{}).ProxyRequired())
-}
-
 func TestEKSStepNilTarget(t *testing.T) {
 	err := (&EKSStep{}).Run(context.Background())
 	require.Error(t, err)
@@ -145,10 +137,6 @@ func TestEKSStepUnsupportedCloud(t *testing.T) {
 	assert.Contains(t, err.Error(), "unsupported cloud provider for eks")
 }
 
-func TestClusterStepName(t *testing.T) {
-	assert.Equal(t, "cluster", (&ClusterStep{}).Name())
-}
-
 func TestClusterStepRejectsNonControlRoom(t *testing.T) {
 	tgt := &typestest.MockTarget{}
 	tgt.On("ControlRoom").Return(false)
@@ -261,7 +249,7 @@ func TestAWSEKSDeployCore(t *testing.T) {
 
 	// Access-entries auth path: admin access entry + node access entry created
 	// (no aws-auth ConfigMapPatch).
-	assert.Len(t, mocks.byType("kubernetes:core/v1:ConfigMapPatch"), 0)
+	assert.Empty(t, mocks.byType("kubernetes:core/v1:ConfigMapPatch"))
 	assert.GreaterOrEqual(t, len(mocks.byType("aws:eks/accessEntry:AccessEntry")), 2)
 
 	// Tigera/Calico: namespace + helm release + 2 patches.
@@ -320,7 +308,7 @@ func TestAWSEKSDeployAccessEntriesDefaultOn(t *testing.T) {
 	require.NoError(t, err)
 
 	// Access-entries path: no aws-auth ConfigMapPatch, access entries created.
-	assert.Len(t, mocks.byType("kubernetes:core/v1:ConfigMapPatch"), 0)
+	assert.Empty(t, mocks.byType("kubernetes:core/v1:ConfigMapPatch"))
 	assert.GreaterOrEqual(t, len(mocks.byType("aws:eks/accessEntry:AccessEntry")), 2)
 }
 
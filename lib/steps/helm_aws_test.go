@@ -1,49 +1,19 @@
 package steps
 
 import (
-	"sync"
 	"testing"
 
 	"github.com/posit-dev/ptd/lib/types"
-	"github.com/pulumi/pulumi/sdk/v3/go/common/resource"
 	"github.com/pulumi/pulumi/sdk/v3/go/pulumi"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 	yamlv2 "gopkg.in/yaml.v2"
 )
 
-// helmAWSMocks records created resources for inspection.
-type helmAWSMocks struct {
-	mu        sync.Mutex
-	resources []pulumi.MockResourceArgs
-}
-
-func (m *helmAWSMocks) NewResource(args pulumi.MockResourceArgs) (string, resource.PropertyMap, error) {
-	m.mu.Lock()
-	defer m.mu.Unlock()
-	m.resources = append(m.resources, args)
-	return args.Name + "_id", args.Inputs, nil
-}
-
-func (m *helmAWSMocks) Call(args pulumi.MockCallArgs) (resource.PropertyMap, error) {
-	return resource.PropertyMap{}, nil
-}
-
-func (m *helmAWSMocks) find(name string) *pulumi.MockResourceArgs {
-	m.mu.Lock()
-	defer m.mu.Unlock()
-	for i := range m.resources {
-		if m.resources[i].Name == name {
-			return &m.resources[i]
-		}
-	}
-	return nil
-}
-
 // runAwsHelmTraefik invokes awsHelmTraefik in isolation with no-op providers/aliases.
-func runAwsHelmTraefik(t *testing.T, replicas int) *helmAWSMocks {
+func runAwsHelmTraefik(t *testing.T, replicas int) *recordingMocks {
 	t.Helper()
-	mocks := &helmAWSMocks{}
+	mocks := &recordingMocks{}
 	noopOpt := pulumi.Aliases(nil)
 	withAlias := func(string, string) pulumi.ResourceOption { return pulumi.Aliases(nil) }
 	err := pulumi.RunErr(func(ctx *pulumi.Context) error {
@@ -98,9 +68,9 @@ func TestAwsHelmTraefikHA(t *testing.T) {
 }
 
 // runAwsHelmAlloy invokes awsHelmAlloy in isolation with no-op providers/aliases.
-func runAwsHelmAlloy(t *testing.T, controlRoomDomain string) *helmAWSMocks {
+func runAwsHelmAlloy(t *testing.T, controlRoomDomain string) *recordingMocks {
 	t.Helper()
-	mocks := &helmAWSMocks{}
+	mocks := &recordingMocks{}
 	noopOpt := pulumi.Aliases(nil)
 	withAlias := func(string, string) pulumi.ResourceOption { return pulumi.Aliases(nil) }
 	withNestedAlias := func(string, string, string) pulumi.ResourceOption { return pulumi.Aliases(nil) }
@@ -125,7 +95,7 @@ func runAwsHelmAlloy(t *testing.T, controlRoomDomain string) *helmAWSMocks {
 }
 
 // alloyChartValues unmarshals the Alloy HelmChart CR's valuesContent for inspection.
-func alloyChartValues(t *testing.T, mocks *helmAWSMocks) map[string]interface{} {
+func alloyChartValues(t *testing.T, mocks *recordingMocks) map[string]interface{} {
 	t.Helper()
 	chart := mocks.find("wl01-staging-20250101-grafana-alloy-release")
 	require.NotNil(t, chart, "alloy HelmChart CR not created")
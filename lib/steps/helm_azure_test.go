@@ -10,10 +10,9 @@ import (
 )
 
 // runAzureHelmAlloy invokes azureHelmAlloy in isolation with no-op providers/aliases.
-// It reuses the helmAWSMocks recorder from helm_aws_test.go (same package).
-func runAzureHelmAlloy(t *testing.T, controlRoomDomain string) *helmAWSMocks {
+func runAzureHelmAlloy(t *testing.T, controlRoomDomain string) *recordingMocks {
 	t.Helper()
-	mocks := &helmAWSMocks{}
+	mocks := &recordingMocks{}
 	noopOpt := pulumi.Aliases(nil)
 	withAlias := func(string, string) pulumi.ResourceOption { return pulumi.Aliases(nil) }
 	withNestedAlias := func(string, string, string) pulumi.ResourceOption { return pulumi.Aliases(nil) }
@@ -39,7 +38,7 @@ func runAzureHelmAlloy(t *testing.T, controlRoomDomain string) *helmAWSMocks {
 }
 
 // azureAlloyChartValues unmarshals the Alloy HelmChart CR's valuesContent for inspection.
-func azureAlloyChartValues(t *testing.T, mocks *helmAWSMocks) map[string]interface{} {
+func azureAlloyChartValues(t *testing.T, mocks *recordingMocks) map[string]interface{} {
 	t.Helper()
 	chart := mocks.find("wl01-staging-20250101-grafana-alloy-release")
 	require.NotNil(t, chart, "alloy HelmChart CR not created")
@@ -581,7 +581,7 @@ func buildBlackboxTargets(params alloyConfigParams) string {
 			lowerName := strings.ToLower(comp.name)
 			internalAddress := fmt.Sprintf(`"http://%s-%s.posit-team.svc.cluster.local/%s"`, siteName, lowerName, comp.healthCheckPath)
 
-			sb.WriteString(fmt.Sprintf(`
+			fmt.Fprintf(&sb, `
 target {
   name = "%s-%s"
   address = %s
@@ -594,7 +594,7 @@ target {
     "health_check_url" = %s,
   }
 }
-`, siteName, lowerName, internalAddress, comp.moduleName, tenantName, siteName, lowerName, internalAddress))
+`, siteName, lowerName, internalAddress, comp.moduleName, tenantName, siteName, lowerName, internalAddress)
 
 			if fqdnEnabled {
 				domainPrefix := lowerName
@@ -606,7 +606,7 @@ target {
 				domain := siteConfig.Spec.Domain
 				fqdnAddress := fmt.Sprintf(`"https://%s.%s/%s"`, domainPrefix, domain, comp.healthCheckPath)
 
-				sb.WriteString(fmt.Sprintf(`
+				fmt.Fprintf(&sb, `
 target {
   name = "%s-%s-fqdn"
   address = %s
@@ -619,7 +619,7 @@ target {
     "health_check_url" = %s,
   }
 }
-`, siteName, lowerName, fqdnAddress, comp.moduleName, tenantName, siteName, lowerName, fqdnAddress))
+`, siteName, lowerName, fqdnAddress, comp.moduleName, tenantName, siteName, lowerName, fqdnAddress)
 			}
 		}
 	}
@@ -809,7 +809,8 @@ prometheus.scrape "cloudwatch" {
 
 // buildAzureMonitorConfig generates the Azure Monitor exporter River config block (Azure only).
 func buildAzureMonitorConfig(params alloyConfigParams) string {
-	config := fmt.Sprintf(`
+	var sb strings.Builder
+	fmt.Fprintf(&sb, `
 prometheus.exporter.azure "postgres" {
     subscriptions    = ["%s"]
     resource_type    = "Microsoft.DBforPostgreSQL/flexibleServers"
@@ -878,7 +879,7 @@ prometheus.scrape "azure_storage" {
 	)
 
 	if params.publicSubnetCidr != "" {
-		config += fmt.Sprintf(`
+		fmt.Fprintf(&sb, `
 prometheus.exporter.azure "natgateway" {
     subscriptions    = ["%s"]
     resource_type    = "Microsoft.Network/natGateways"
@@ -896,7 +897,7 @@ prometheus.scrape "azure_natgateway" {
 `, params.subscriptionID, params.resourceGroupName)
 	}
 
-	return config
+	return sb.String()
 }
 
 // formatLBTags builds the ALB annotation tag string (posit.team/true-name=X,posit.team/environment=Y,Name=Z).
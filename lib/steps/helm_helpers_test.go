@@ -0,0 +1,65 @@
+package steps
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestFormatLBTags(t *testing.T) {
+	tests := []struct {
+		name string
+		tags map[string]string
+		want string
+	}{
+		{
+			name: "empty map",
+			tags: map[string]string{},
+			want: "",
+		},
+		{
+			name: "single tag",
+			tags: map[string]string{"Name": "wl01-staging"},
+			want: "Name=wl01-staging",
+		},
+		{
+			name: "keys are sorted",
+			tags: map[string]string{"b": "2", "c": "3", "a": "1"},
+			want: "a=1,b=2,c=3",
+		},
+		{
+			name: "control room traefik nlb tags",
+			tags: map[string]string{
+				"posit.team/true-name":   "myapp",
+				"posit.team/environment": "production",
+				"Name":                   "myapp-production",
+			},
+			want: "Name=myapp-production,posit.team/environment=production,posit.team/true-name=myapp",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			assert.Equal(t, tt.want, formatLBTags(tt.tags))
+		})
+	}
+}
+
+func TestBuildAzureMonitorConfigNatGateway(t *testing.T) {
+	params := alloyConfigParams{
+		subscriptionID:           "00000000-0000-0000-0000-000000000000",
+		resourceGroupName:        "rsg-ptd-wl01-staging",
+		clusterResourceGroupName: "rsg-ptd-wl01-staging-cluster",
+	}
+
+	config := buildAzureMonitorConfig(params)
+	assert.Contains(t, config, `prometheus.exporter.azure "postgres"`)
+	assert.Contains(t, config, `prometheus.scrape "azure_storage"`)
+	assert.NotContains(t, config, "natgateway")
+
+	params.publicSubnetCidr = "10.0.0.0/24"
+	config = buildAzureMonitorConfig(params)
+	assert.Contains(t, config, `prometheus.exporter.azure "natgateway"`)
+	assert.Contains(t, config, "where resourceGroup == 'rsg-ptd-wl01-staging'")
+	assert.Contains(t, config, `prometheus.scrape "azure_natgateway"`)
+}
@@ -408,15 +408,6 @@ func persistentVPCEndpointConfig(params awsWorkloadPersistentParams) (bool, []st
 	return params.cfg.VPCEndpoints.Enabled, params.cfg.VPCEndpoints.ExcludedServices
 }
 
-func contains(list []string, s string) bool {
-	for _, v := range list {
-		if v == s {
-			return true
-		}
-	}
-	return false
-}
-
 // protoNum returns the numeric IP protocol for a NACL/SG protocol string.
 func protoNum(p string) int {
 	switch p {
@@ -549,7 +540,7 @@ func buildPersistentVPC(ctx *pulumi.Context, params awsWorkloadPersistentParams)
 	enabled, excluded := persistentVPCEndpointConfig(params)
 	if enabled {
 		for _, svc := range standardVPCEndpointServices {
-			if contains(excluded, svc) {
+			if slices.Contains(excluded, svc) {
 				continue
 			}
 			if err := vpc.WithEndpoint(svc); err != nil {
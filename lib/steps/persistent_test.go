@@ -174,6 +174,48 @@ func TestAWSWorkloadPersistentDeploy_GreenfieldMultiAZ(t *testing.T) {
 	}
 }
 
+func TestPersistentVPCEndpointConfig(t *testing.T) {
+	tests := []struct {
+		name         string
+		vpcEndpoints *types.VPCEndpointsConfig
+		wantEnabled  bool
+		wantExcluded []string
+	}{
+		{
+			name:        "absent block defaults to enabled with no exclusions",
+			wantEnabled: true,
+		},
+		{
+			name:         "enabled with exclusions",
+			vpcEndpoints: &types.VPCEndpointsConfig{Enabled: true, ExcludedServices: []string{"fsx", "kms"}},
+			wantEnabled:  true,
+			wantExcluded: []string{"fsx", "kms"},
+		},
+		{
+			name:         "enabled with empty exclusions",
+			vpcEndpoints: &types.VPCEndpointsConfig{Enabled: true, ExcludedServices: []string{}},
+			wantEnabled:  true,
+			wantExcluded: []string{},
+		},
+		{
+			name:         "disabled",
+			vpcEndpoints: &types.VPCEndpointsConfig{Enabled: false},
+			wantEnabled:  false,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			params := baseAWSWorkloadPersistentParams()
+			params.cfg.VPCEndpoints = tt.vpcEndpoints
+
+			enabled, excluded := persistentVPCEndpointConfig(params)
+			assert.Equal(t, tt.wantEnabled, enabled)
+			assert.Equal(t, tt.wantExcluded, excluded)
+		})
+	}
+}
+
 func TestAWSWorkloadPersistentDeploy_TailscaleNoBastion(t *testing.T) {
 	mocks := &persistentMocks{}
 	params := baseAWSWorkloadPersistentParams()
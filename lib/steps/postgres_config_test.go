@@ -2,7 +2,6 @@ package steps
 
 import (
 	"context"
-	"sync"
 	"testing"
 
 	"github.com/pulumi/pulumi/sdk/v3/go/common/resource"
@@ -14,16 +13,6 @@ import (
 	"github.com/posit-dev/ptd/lib/types/typestest"
 )
 
-func TestPostgresConfigStepName(t *testing.T) {
-	step := &PostgresConfigStep{}
-	assert.Equal(t, "postgres_config", step.Name())
-}
-
-func TestPostgresConfigStepProxyRequired(t *testing.T) {
-	step := &PostgresConfigStep{}
-	assert.True(t, step.ProxyRequired())
-}
-
 func TestPostgresConfigStepNilTarget(t *testing.T) {
 	step := &PostgresConfigStep{}
 	step.Set(nil, nil, StepOptions{})
@@ -50,23 +39,6 @@ func TestParseDBSecretField(t *testing.T) {
 	})
 }
 
-// postgresConfigMocks implements pulumi.MockResourceMonitor for testing the deploy function.
-type postgresConfigMocks struct {
-	mu        sync.Mutex
-	resources []pulumi.MockResourceArgs
-}
-
-func (m *postgresConfigMocks) NewResource(args pulumi.MockResourceArgs) (string, resource.PropertyMap, error) {
-	m.mu.Lock()
-	defer m.mu.Unlock()
-	m.resources = append(m.resources, args)
-	return args.Name + "_id", args.Inputs, nil
-}
-
-func (m *postgresConfigMocks) Call(args pulumi.MockCallArgs) (resource.PropertyMap, error) {
-	return resource.PropertyMap{}, nil
-}
-
 func mockAWSTarget(name string, isControlRoom bool) *typestest.MockTarget {
 	tgt := &typestest.MockTarget{}
 	tgt.On("Name").Return(name)
@@ -94,7 +66,7 @@ func mockAzureTarget(name string) *typestest.MockTarget {
 // --- AWS deploy tests ---
 
 func TestAWSPostgresConfigDeployControlRoom(t *testing.T) {
-	mocks := &postgresConfigMocks{}
+	mocks := &recordingMocks{}
 
 	err := pulumi.RunErr(func(ctx *pulumi.Context) error {
 		target := mockAWSTarget("test-aws-ctrl", true)
@@ -136,7 +108,7 @@ func TestAWSPostgresConfigDeployControlRoom(t *testing.T) {
 }
 
 func TestAWSPostgresConfigDeployWorkload(t *testing.T) {
-	mocks := &postgresConfigMocks{}
+	mocks := &recordingMocks{}
 
 	err := pulumi.RunErr(func(ctx *pulumi.Context) error {
 		target := mockAWSTarget("test-aws-staging", false)
@@ -158,7 +130,7 @@ func TestAWSPostgresConfigDeployWorkload(t *testing.T) {
 }
 
 func TestAWSPostgresConfigDeployWorkloadWithExtraDbs(t *testing.T) {
-	mocks := &postgresConfigMocks{}
+	mocks := &recordingMocks{}
 
 	err := pulumi.RunErr(func(ctx *pulumi.Context) error {
 		target := mockAWSTarget("test-aws-staging", false)
@@ -182,7 +154,7 @@ func TestAWSPostgresConfigDeployWorkloadWithExtraDbs(t *testing.T) {
 }
 
 func TestAWSPostgresConfigDeployExtraDbHyphenSanitization(t *testing.T) {
-	mocks := &postgresConfigMocks{}
+	mocks := &recordingMocks{}
 
 	err := pulumi.RunErr(func(ctx *pulumi.Context) error {
 		target := mockAWSTarget("test-aws-staging", false)
@@ -199,7 +171,7 @@ func TestAWSPostgresConfigDeployExtraDbHyphenSanitization(t *testing.T) {
 }
 
 func TestAWSPostgresConfigDeployProviderConfig(t *testing.T) {
-	mocks := &postgresConfigMocks{}
+	mocks := &recordingMocks{}
 
 	err := pulumi.RunErr(func(ctx *pulumi.Context) error {
 		target := mockAWSTarget("test-aws-ctrl", true)
@@ -222,7 +194,7 @@ func TestAWSPostgresConfigDeployProviderConfig(t *testing.T) {
 // --- Azure deploy tests ---
 
 func TestAzurePostgresConfigDeploySingleCluster(t *testing.T) {
-	mocks := &postgresConfigMocks{}
+	mocks := &recordingMocks{}
 
 	err := pulumi.RunErr(func(ctx *pulumi.Context) error {
 		target := mockAzureTarget("test-az-staging")
@@ -264,7 +236,7 @@ func TestAzurePostgresConfigDeploySingleCluster(t *testing.T) {
 }
 
 func TestAzurePostgresConfigDeployMultipleClusters(t *testing.T) {
-	mocks := &postgresConfigMocks{}
+	mocks := &recordingMocks{}
 
 	err := pulumi.RunErr(func(ctx *pulumi.Context) error {
 		target := mockAzureTarget("test-az-staging")
@@ -286,7 +258,7 @@ func TestAzurePostgresConfigDeployMultipleClusters(t *testing.T) {
 }
 
 func TestAzurePostgresConfigDeployProviderConfig(t *testing.T) {
-	mocks := &postgresConfigMocks{}
+	mocks := &recordingMocks{}
 
 	err := pulumi.RunErr(func(ctx *pulumi.Context) error {
 		target := mockAzureTarget("test-az-staging")
@@ -313,7 +285,7 @@ func TestAzurePostgresConfigDeployProviderConfig(t *testing.T) {
 }
 
 func TestAzurePostgresConfigDeployKeyVaultSecret(t *testing.T) {
-	mocks := &postgresConfigMocks{}
+	mocks := &recordingMocks{}
 
 	err := pulumi.RunErr(func(ctx *pulumi.Context) error {
 		target := mockAzureTarget("test-az-staging")
@@ -14,16 +14,6 @@ import (
 	"github.com/posit-dev/ptd/lib/types"
 )
 
-func TestSitesStepName(t *testing.T) {
-	step := &SitesStep{}
-	assert.Equal(t, "sites", step.Name())
-}
-
-func TestSitesStepProxyRequired(t *testing.T) {
-	step := &SitesStep{}
-	assert.True(t, step.ProxyRequired())
-}
-
 // sitesMocks implements pulumi.MockResourceMonitor for testing the deploy functions.
 type sitesMocks struct {
 	resources []pulumi.MockResourceArgs
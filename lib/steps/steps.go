@@ -127,14 +127,9 @@ func StartAtStep(allSteps []Step, startAtStep string) ([]Step, error) {
 		return allSteps, nil
 	}
 
-	start := -1
-	for i, step := range allSteps {
-		if step.Name() == startAtStep {
-			start = i
-			break
-		}
-	}
-
+	start := slices.IndexFunc(allSteps, func(step Step) bool {
+		return step.Name() == startAtStep
+	})
 	if start == -1 {
 		return nil, fmt.Errorf("step %s not in steps to run list: %s", startAtStep, Names(allSteps))
 	}
@@ -2,9 +2,11 @@ package steps
 
 import (
 	"context"
+	"sync"
 	"testing"
 
 	"github.com/pulumi/pulumi/sdk/v3/go/auto"
+	"github.com/pulumi/pulumi/sdk/v3/go/common/resource"
 	psdk "github.com/pulumi/pulumi/sdk/v3/go/pulumi"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/mock"
@@ -88,6 +90,73 @@ func TestResolveStackStep(t *testing.T) {
 	}
 }
 
+func TestStepNameAndProxyRequired(t *testing.T) {
+	tests := []struct {
+		step              Step
+		wantName          string
+		wantProxyRequired bool
+	}{
+		{step: &WorkspacesStep{}, wantName: "workspaces", wantProxyRequired: false},
+		{step: &ClusterStep{}, wantName: "cluster", wantProxyRequired: true},
+		{step: &EKSStep{}, wantName: "eks", wantProxyRequired: true},
+		{step: &ClustersStep{}, wantName: "clusters", wantProxyRequired: true},
+		{step: &PostgresConfigStep{}, wantName: "postgres_config", wantProxyRequired: true},
+		{step: &SitesStep{}, wantName: "sites", wantProxyRequired: true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.wantName, func(t *testing.T) {
+			assert.Equal(t, tt.wantName, tt.step.Name())
+			assert.Equal(t, tt.wantProxyRequired, tt.step.ProxyRequired())
+		})
+	}
+}
+
+func TestStartAtStep(t *testing.T) {
+	allSteps := []Step{&BootstrapStep{}, &PersistentStep{}, &HelmStep{}}
+
+	got, err := StartAtStep(allSteps, "")
+	assert.NoError(t, err)
+	assert.Equal(t, allSteps, got)
+
+	got, err = StartAtStep(allSteps, "persistent")
+	assert.NoError(t, err)
+	assert.Equal(t, []string{"persistent", "helm"}, Names(got))
+
+	_, err = StartAtStep(allSteps, "bogus")
+	assert.ErrorContains(t, err, "step bogus not in steps to run list")
+}
+
+// recordingMocks implements pulumi.MockResourceMonitor for deploy tests that
+// only need to inspect the resources created; every invoke returns an empty
+// result. Tests that stub data sources define their own Call.
+type recordingMocks struct {
+	mu        sync.Mutex
+	resources []psdk.MockResourceArgs
+}
+
+func (m *recordingMocks) NewResource(args psdk.MockResourceArgs) (string, resource.PropertyMap, error) {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+	m.resources = append(m.resources, args)
+	return args.Name + "_id", args.Inputs, nil
+}
+
+func (m *recordingMocks) Call(args psdk.MockCallArgs) (resource.PropertyMap, error) {
+	return resource.PropertyMap{}, nil
+}
+
+func (m *recordingMocks) find(name string) *psdk.MockResourceArgs {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+	for i := range m.resources {
+		if m.resources[i].Name == name {
+			return &m.resources[i]
+		}
+	}
+	return nil
+}
+
 type stepTestHandler struct {
 	stack  auto.Stack
 	target types.Target
@@ -108,16 +108,6 @@ func (m *workspacesMocks) findResource(name string) *pulumi.MockResourceArgs {
 // Step metadata tests
 // ---------------------------------------------------------------------------
 
-func TestWorkspacesStepName(t *testing.T) {
-	step := &WorkspacesStep{}
-	assert.Equal(t, "workspaces", step.Name())
-}
-
-func TestWorkspacesStepProxyRequired(t *testing.T) {
-	step := &WorkspacesStep{}
-	assert.False(t, step.ProxyRequired())
-}
-
 func TestWorkspacesStepNilTarget(t *testing.T) {
 	step := &WorkspacesStep{}
 	step.Set(nil, nil, StepOptions{})
@@ -9,9 +9,32 @@ package types
 // which mismatches Python and would DELETE the live EKS access entries. Resolve
 // via IsEnabled / the spec-level UsesEksAccessEntries helpers (nil → true).
 type EKSAccessEntriesConfig struct {
-	Enabled                     *bool                    `json:"enabled" yaml:"enabled"`
-	AdditionalEntries           []map[string]interface{} `json:"additional_entries" yaml:"additional_entries"`
-	IncludeSameAccountPoweruser bool                     `json:"include_same_account_poweruser" yaml:"include_same_account_poweruser"`
+	Enabled                     *bool            `json:"enabled" yaml:"enabled"`
+	AdditionalEntries           []EKSAccessEntry `json:"additional_entries" yaml:"additional_entries"`
+	IncludeSameAccountPoweruser bool             `json:"include_same_account_poweruser" yaml:"include_same_account_poweruser"`
+}
+
+// EKSAccessEntry is one extra access entry from eks_access_entries.additional_entries.
+// The keys are camelCase because Python passed these dicts straight through to the
+// EKS API shapes. Type defaults to STANDARD and AccessScope.Type to "cluster" when
+// empty (see EKSCluster.withEksAccessEntries); entries without a PrincipalArn are skipped.
+type EKSAccessEntry struct {
+	PrincipalArn     string            `json:"principalArn" yaml:"principalArn"`
+	Type             string            `json:"type" yaml:"type"`
+	KubernetesGroups []string          `json:"kubernetesGroups" yaml:"kubernetesGroups"`
+	AccessPolicies   []EKSAccessPolicy `json:"accessPolicies" yaml:"accessPolicies"`
+}
+
+// EKSAccessPolicy associates an EKS access policy with an EKSAccessEntry.
+type EKSAccessPolicy struct {
+	PolicyArn   string         `json:"policyArn" yaml:"policyArn"`
+	AccessScope EKSAccessScope `json:"accessScope" yaml:"accessScope"`
+}
+
+// EKSAccessScope limits an EKSAccessPolicy to the cluster or a set of namespaces.
+type EKSAccessScope struct {
+	Type       string   `json:"type" yaml:"type"`
+	Namespaces []string `json:"namespaces" yaml:"namespaces"`
 }
 
 // IsEnabled resolves the access-entries Enabled flag (Python default True).
@@ -5,6 +5,7 @@ import (
 
 	"github.com/google/uuid"
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 	yaml "sigs.k8s.io/yaml/goyaml.v3"
 )
 
@@ -474,6 +475,36 @@ func TestUsesEksAccessEntries(t *testing.T) {
 	}
 }
 
+func TestEKSAccessEntriesAdditionalEntriesFromYAML(t *testing.T) {
+	// additional_entries keeps the camelCase EKS API keys the Python dicts used.
+	raw := `
+eks_access_entries:
+  additional_entries:
+    - principalArn: arn:aws:iam::123456789012:role/reader
+      kubernetesGroups: [viewers]
+      accessPolicies:
+        - policyArn: arn:aws:eks::aws:cluster-access-policy/AmazonEKSViewPolicy
+          accessScope:
+            type: namespace
+            namespaces: [posit-team]
+    - principalArn: arn:aws:iam::123456789012:role/admin
+      type: STANDARD
+`
+	var spec AWSWorkloadClusterSpec
+	require.NoError(t, yaml.Unmarshal([]byte(raw), &spec))
+
+	entries := spec.EksAccessEntries.AdditionalEntries
+	require.Len(t, entries, 2)
+	assert.Equal(t, "arn:aws:iam::123456789012:role/reader", entries[0].PrincipalArn)
+	assert.Empty(t, entries[0].Type)
+	assert.Equal(t, []string{"viewers"}, entries[0].KubernetesGroups)
+	require.Len(t, entries[0].AccessPolicies, 1)
+	assert.Equal(t, "arn:aws:eks::aws:cluster-access-policy/AmazonEKSViewPolicy", entries[0].AccessPolicies[0].PolicyArn)
+	assert.Equal(t, EKSAccessScope{Type: "namespace", Namespaces: []string{"posit-team"}}, entries[0].AccessPolicies[0].AccessScope)
+	assert.Equal(t, "STANDARD", entries[1].Type)
+	assert.Empty(t, entries[1].AccessPolicies)
+}
+
 func TestAnyClusterExternalSecretsEnabled(t *testing.T) {
 	t.Run("no clusters enabled", func(t *testing.T) {
 		cfg := AzureWorkloadConfig{Clusters: map[string]AzureWorkloadClusterConfig{